@@ -1,9 +1,10 @@
 import re
-from collections import defaultdict
+import sys
+from functools import lru_cache
+from itertools import groupby
 
 import tinycss2
 
-_HEX_RE = re.compile(r"^#(?:[0-9a-f]{3}){1,2}$", re.I)
 # captures      r  g  b  [a]
 _RGBA_RE = re.compile(
     r"^rgba?\(\s*"
@@ -14,6 +15,14 @@ _RGBA_RE = re.compile(
     r"\s*\)$",
     re.I,
 )
+# Canonical rgb()/rgba() literals are ASCII, so deleting every other ASCII
+# character leaves just the digits.
+_NON_DIGIT_DELETION = {i: None for i in range(128) if not chr(i).isdigit()}
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_RGBA_PREFIXES = ("rgb(", "rgba(")
+_LEADING_HASH_RE = re.compile(r"^#")
+_NONWORD_RE = re.compile(r"[^\w-]")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
 
 # --- Qt Styling Information (Comprehensive Lists for Reference) ---
 
@@ -465,13 +474,29 @@ CSS_PROPERTY_TO_QSS_PROPERTY = {
     "grid-template-rows": None,
 }
 
+# Most entries map a property to itself; keep those as a set and only the
+# (currently empty) set of real renames as a dict. None entries, like
+# properties missing from the table, have no QSS equivalent.
+_QSS_PASSTHROUGH = frozenset(
+    k for k, v in CSS_PROPERTY_TO_QSS_PROPERTY.items() if v == k
+)
+_QSS_RENAMED = {
+    k: v for k, v in CSS_PROPERTY_TO_QSS_PROPERTY.items() if v is not None and v != k
+}
 
-def _extract_colors_from_component_values(component_values, unique_colors_set):
-    for cv in component_values:
-        if cv.type == "hash" and not cv.is_identifier:
-            unique_colors_set.add(f"#{cv.value}")
-        elif cv.type == "function" and cv.name in ("rgb", "rgba"):
-            unique_colors_set.add(tinycss2.serialize([cv]))
+
+def qss_property_for(css_prop):
+    if css_prop in _QSS_PASSTHROUGH:
+        return css_prop
+    return _QSS_RENAMED.get(css_prop)
+
+
+for _mapping in CSS_CLASS_TO_QT_MAPPING.values():
+    for _key, _value in _mapping.items():
+        _mapping[_key] = sys.intern(_value)
+for _key, _value in CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE.items():
+    CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE[_key] = sys.intern(_value)
+del _mapping, _key, _value
 
 
 def _parse_css_linear_gradient_to_qss(css_gradient_args):
@@ -558,21 +583,15 @@ def _parse_css_linear_gradient_to_qss(css_gradient_args):
     ):
         arg_idx += 1
 
-    raw_stops = []
-    current_stop_parts = []
-    while arg_idx < len(css_gradient_args):
-        token = css_gradient_args[arg_idx]
-        arg_idx += 1
-        if token.type == "whitespace":
-            continue
-        if token.type == "literal" and token.value == ",":
-            if current_stop_parts:
-                raw_stops.append(current_stop_parts)
-            current_stop_parts = []
-            continue
-        current_stop_parts.append(token)
-    if current_stop_parts:
-        raw_stops.append(current_stop_parts)
+    # Remaining tokens, whitespace dropped, split into stops at commas.
+    tail = [t for t in css_gradient_args[arg_idx:] if t.type != "whitespace"]
+    raw_stops = [
+        list(parts)
+        for is_comma, parts in groupby(
+            tail, key=lambda t: t.type == "literal" and t.value == ","
+        )
+        if not is_comma
+    ]
 
     num_stops = len(raw_stops)
     for i, stop_parts in enumerate(raw_stops):
@@ -611,13 +630,51 @@ def _parse_css_linear_gradient_to_qss(css_gradient_args):
     return f"qlineargradient({', '.join(f'{k}: {v}' for k, v in qss_coords.items())}, {', '.join(qss_stops)})"
 
 
+def _fast_value_serialize(component_values, unique_colors=None):
+    # Serialized text for the most common value shape, a single hash or plain
+    # ident token (custom properties keep the whitespace around it), or None
+    # when the value needs the general serializer.
+    value_text = None
+    parts = []
+    for cv in component_values:
+        if cv.type == "whitespace":
+            parts.append(cv.value)
+            continue
+        if value_text is not None:
+            return None
+        # Plain ASCII names serialize as written; a hash whose value starts
+        # with a digit but counts as an identifier was escaped in the source.
+        if (
+            cv.type == "hash"
+            and cv.value.isascii()
+            and cv.value.isalnum()
+            and not (cv.is_identifier and cv.value[0].isdigit())
+        ):
+            value_text = f"#{cv.value}"
+            if unique_colors is not None and not cv.is_identifier:
+                unique_colors.add(value_text)
+        elif cv.type == "ident" and cv.value.isascii() and cv.value.isalpha():
+            value_text = cv.value
+        else:
+            return None
+        parts.append(value_text)
+    if value_text is None:
+        return None
+    return "".join(parts)
+
+
 def _serialize_component_values_to_qss_property_value(
-    component_values, attempt_gradient_conversion=False
+    component_values, attempt_gradient_conversion=False, unique_colors=None
 ):
+    # When `unique_colors` (a set) is given, top-level hex and rgb()/rgba()
+    # colours are collected into it during the same pass.
+    fast_value = _fast_value_serialize(component_values, unique_colors)
+    if fast_value is not None:
+        return fast_value
     qss_value_parts = []
     for cv in component_values:
         if cv.type == "function":
-            func_name = cv.name.lower()
+            func_name = cv.lower_name
             if func_name == "var":
                 cleaned_args = [scv for scv in cv.arguments if scv.type != "whitespace"]
                 if cleaned_args:
@@ -632,12 +689,88 @@ def _serialize_component_values_to_qss_property_value(
                     qss_gradient if qss_gradient else tinycss2.serialize([cv])
                 )
             else:
-                qss_value_parts.append(tinycss2.serialize([cv]))
+                serialized = tinycss2.serialize([cv])
+                if unique_colors is not None and cv.name in ("rgb", "rgba"):
+                    unique_colors.add(serialized)
+                qss_value_parts.append(serialized)
         else:
+            if unique_colors is not None and cv.type == "hash" and not cv.is_identifier:
+                unique_colors.add(f"#{cv.value}")
             qss_value_parts.append(tinycss2.serialize([cv]))
     return "".join(qss_value_parts)
 
 
+# The selector keys the general-rule branch looks for, found with one regex
+# scan per regex instead of one substring test each.
+_SELECTOR_ANCHOR_RE = re.compile(r"menubar-menu-(title|button)")
+_SELECTOR_STATE_RE = re.compile(r"\.open|:focus|:hover")
+
+
+def _split_selector_list(prelude):
+    # tinycss2 has no selector parser; split the prelude's tokens on
+    # top-level commas instead.
+    selectors, current = [], []
+    for token in prelude:
+        if token.type == "literal" and token.value == ",":
+            selectors.append(current)
+            current = []
+        else:
+            current.append(token)
+    selectors.append(current)
+    return selectors
+
+
+# Handlers for the selectors that are not translated to Qt widgets. Both take
+# the same arguments: the rule's declarations and the conversion's output
+# collections.
+def _handle_root_rule(
+    declarations,
+    css_variables_map,
+    ida_qss_defs,
+    ida_qss_body_styles,
+    unique_colors_set,
+):
+    for decl in declarations:
+        if decl.type == "declaration":
+            var_name = decl.name
+            var_val_qss = _serialize_component_values_to_qss_property_value(
+                decl.value, True, unique_colors_set
+            )
+            css_variables_map[var_name] = var_val_qss
+            ida_qss_defs.append(f"@def {var_name} {var_val_qss};")
+
+
+def _handle_body_rule(
+    declarations,
+    css_variables_map,
+    ida_qss_defs,
+    ida_qss_body_styles,
+    unique_colors_set,
+):
+    ida_qss_body_styles.append("body {")
+    for decl in declarations:
+        if decl.type == "declaration":
+            prop_name = decl.name
+            prop_val_qss = _serialize_component_values_to_qss_property_value(
+                decl.value, True
+            )
+            ida_qss_body_styles.append(f"  {prop_name}: {prop_val_qss};")
+    ida_qss_body_styles.append("}")
+
+
+# Keyed on the lowercased selector; selectors are case-insensitive.
+_SPECIAL_SELECTORS = {":root": _handle_root_rule, "body": _handle_body_rule}
+
+
+@lru_cache(maxsize=8)
+def _parse_stylesheet_cached(css_content):
+    return tuple(
+        tinycss2.parse_stylesheet(
+            css_content, skip_comments=True, skip_whitespace=True
+        )
+    )
+
+
 def parse_vscode_css_to_ida_qss_tinycss2(css_content):
     ida_qss_defs, ida_qss_body_styles, css_variables_map, general_qss_rules = (
         [],
@@ -646,9 +779,18 @@ def parse_vscode_css_to_ida_qss_tinycss2(css_content):
         [],
     )
     unique_colors_set = set()
-    rules = tinycss2.parse_stylesheet(
-        css_content, skip_comments=True, skip_whitespace=True
+    rules = _parse_stylesheet_cached(css_content)
+    # Selector translation only ever needs these few table entries; look them
+    # up once rather than per selector.
+    menubar_widget = CSS_CLASS_TO_QT_MAPPING.get("menubar-menu-button", {}).get(
+        "qt_widget", "QMenuBar"
+    )
+    menubar_item = CSS_CLASS_TO_QT_MAPPING.get("menubar-menu-title", {}).get(
+        "qt_sub_control", "::item"
     )
+    open_state = CSS_CLASS_TO_QT_MAPPING.get("open", {}).get("qt_pseudo_state")
+    focus_state = CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE.get("focus")
+    hover_state = CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE.get("hover")
 
     for rule in rules:
         if rule.type == "error":
@@ -660,86 +802,48 @@ def parse_vscode_css_to_ida_qss_tinycss2(css_content):
                 rule.content, skip_comments=True, skip_whitespace=True
             )
 
-            if selector_string_raw == ":root":
-                for decl in declarations:
-                    if decl.type == "declaration":
-                        var_name = decl.name
-                        var_val_qss = _serialize_component_values_to_qss_property_value(
-                            decl.value, True
-                        )
-                        css_variables_map[var_name] = var_val_qss
-                        ida_qss_defs.append(f"@def {var_name} {var_val_qss};")
-                        _extract_colors_from_component_values(
-                            decl.value, unique_colors_set
-                        )
-            elif selector_string_raw == "body":
-                ida_qss_body_styles.append("body {")
-                for decl in declarations:
-                    if decl.type == "declaration":
-                        prop_name = decl.name
-                        prop_val_qss = (
-                            _serialize_component_values_to_qss_property_value(
-                                decl.value, True
-                            )
-                        )
-                        ida_qss_body_styles.append(f"  {prop_name}: {prop_val_qss};")
-                ida_qss_body_styles.append("}")
+            handler = _SPECIAL_SELECTORS.get(selector_string_raw.lower())
+            if handler is not None:
+                handler(
+                    declarations,
+                    css_variables_map,
+                    ida_qss_defs,
+                    ida_qss_body_styles,
+                    unique_colors_set,
+                )
             else:  # General rules
-                translated_qss_selectors = []
-                for sel_ast in tinycss2.parse_selector_list(rule.prelude):
+                translated_qss_selectors = set()
+                for sel_ast in _split_selector_list(rule.prelude):
                     sel_str = tinycss2.serialize(sel_ast).strip().lower()
+                    anchors = set(_SELECTOR_ANCHOR_RE.findall(sel_str))
                     current_qss_sel = ""  # Placeholder for robust selector translation
-                    if "menubar-menu-title" in sel_str:
-                        base = CSS_CLASS_TO_QT_MAPPING.get(
-                            "menubar-menu-button", {}
-                        ).get("qt_widget", "QMenuBar")
-                        sub = CSS_CLASS_TO_QT_MAPPING.get("menubar-menu-title", {}).get(
-                            "qt_sub_control", "::item"
-                        )
-                        current_qss_sel = base + sub
-                    elif "menubar-menu-button" in sel_str:
-                        current_qss_sel = CSS_CLASS_TO_QT_MAPPING.get(
-                            "menubar-menu-button", {}
-                        ).get("qt_widget", "QMenuBar")
+                    if "title" in anchors:
+                        current_qss_sel = menubar_widget + menubar_item
+                    elif "button" in anchors:
+                        current_qss_sel = menubar_widget
                     if not current_qss_sel:
                         continue  # Skip if no base mapping
 
-                    states = []
-                    if ".open" in sel_str:
-                        s = CSS_CLASS_TO_QT_MAPPING.get("open", {}).get(
-                            "qt_pseudo_state"
-                        )
-                        _ = s and states.append(s)
-                    if ":focus" in sel_str:
-                        s = CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE.get("focus")
-                        _ = s and states.append(s)
-                    if ":hover" in sel_str:
-                        s = CSS_PSEUDO_CLASS_TO_QT_PSEUDO_STATE.get("hover")
-                        _ = s and states.append(s)
+                    states = set()
+                    markers = set(_SELECTOR_STATE_RE.findall(sel_str))
+                    if ".open" in markers and open_state:
+                        states.add(open_state)
+                    if ":focus" in markers and focus_state:
+                        states.add(focus_state)
+                    if ":hover" in markers and hover_state:
+                        states.add(hover_state)
                     if states:
-                        current_qss_sel += "".join(sorted(list(set(states))))
+                        current_qss_sel += "".join(sorted(states))
                     if current_qss_sel:
-                        translated_qss_selectors.append(current_qss_sel)
+                        translated_qss_selectors.add(current_qss_sel)
 
                 if not translated_qss_selectors:
                     continue
-                final_qss_selector = ", ".join(
-                    sorted(list(set(translated_qss_selectors)))
-                )
+                final_qss_selector = ", ".join(sorted(translated_qss_selectors))
                 qss_decls = []
                 for decl in declarations:
                     if decl.type == "declaration":
-                        (
-                            css_prop,
-                            qss_prop,
-                        ) = decl.name.lower(), CSS_PROPERTY_TO_QSS_PROPERTY.get(
-                            decl.name.lower()
-                        )
-                        if (
-                            qss_prop is None
-                            and css_prop in CSS_PROPERTY_TO_QSS_PROPERTY
-                        ):
-                            continue
+                        qss_prop = qss_property_for(decl.lower_name)
                         if not qss_prop:
                             continue
                         qss_val = _serialize_component_values_to_qss_property_value(
@@ -747,8 +851,11 @@ def parse_vscode_css_to_ida_qss_tinycss2(css_content):
                         )
                         qss_decls.append(f"  {qss_prop}: {qss_val};")
                 if qss_decls:
-                    general_qss_rules.extend(
-                        [f"{final_qss_selector} {{"] + qss_decls + ["}", ""]
+                    # One pre-joined string per rule block rather than one
+                    # list entry per line.
+                    qss_decls = "\n".join(qss_decls)
+                    general_qss_rules.append(
+                        f"{final_qss_selector} {{\n{qss_decls}\n}}\n"
                     )
 
     # ------------------------------------------------------------------
@@ -764,12 +871,19 @@ def parse_vscode_css_to_ida_qss_tinycss2(css_content):
         "/* Generated IDA Pro QSS Theme from VSCode CSS (using tinycss2) */",
         "/* For use with IDA Pro's QSS theming engine */\n",
     ]
+    # Sections are appended in place rather than concatenated into temporary
+    # lists; everything is joined once at the end.
     if ida_qss_defs:
-        output.extend(["/* Variable Definitions */"] + ida_qss_defs + ["\n"])
+        output.append("/* Variable Definitions */")
+        output.extend(ida_qss_defs)
+        output.append("\n")
     if ida_qss_body_styles:
-        output.extend(["/* Body Styles */"] + ida_qss_body_styles + ["\n"])
+        output.append("/* Body Styles */")
+        output.extend(ida_qss_body_styles)
+        output.append("\n")
     if general_qss_rules:
-        output.extend(["/* General Widget Styles */"] + general_qss_rules)
+        output.append("/* General Widget Styles */")
+        output.extend(general_qss_rules)
 
     metadata = {
         "css_variables": css_variables_map,
@@ -780,9 +894,9 @@ def parse_vscode_css_to_ida_qss_tinycss2(css_content):
 
 def sanitize_for_var_name(text):
     text = text.lower()
-    text = re.sub(r"^#", "", text)  # Remove leading #
-    text = re.sub(r"[^\w-]", "_", text)  # Replace non-alphanumeric (excluding -) with _
-    text = re.sub(r"_+", "_", text)  # Replace multiple underscores with single
+    text = _LEADING_HASH_RE.sub("", text)  # Remove leading #
+    text = _NONWORD_RE.sub("_", text)  # Replace non-alphanumeric (excluding -) with _
+    text = _MULTI_UNDERSCORE_RE.sub("_", text)  # Replace multiple underscores with single
     text = text.strip("_")
     return text
 
@@ -792,19 +906,28 @@ def _dedupe_colors(css_vars):
     Return { '#rrggbb' : [var, var, …] } for any literal that appears ≥2×.
     Only simple hex colours are considered; gradients / rgba() are ignored.
     """
-    buckets = defaultdict(list)
+    # A names list is only allocated once a literal is seen a second time;
+    # colours used by a single variable never leave first_seen.
+    first_seen = {}
+    buckets = {}
+    rgba_match = _RGBA_RE.match
     for var, val in css_vars.items():
         # 1. trim ends, 2. collapse ALL whitespace so "rgba(255, 255, 0, .3)" or
         #    the multi-line variant becomes "rgba(255,255,0,.3)"
-        val_clean = re.sub(r"\s+", "", val.strip().lower())
+        val_clean = "".join(val.lower().split())
 
         # --- HEX ----------------------------------------------------------------
-        if _HEX_RE.match(val_clean):
-            buckets[val_clean].append(var)
+        # "#rgb"/"#rrggbb" on the already-lowercased value; anything that
+        # isn't a hex or rgb()/rgba() literal is skipped before _RGBA_RE runs.
+        if val_clean.startswith("#"):
+            if len(val_clean) in (4, 7) and _HEX_DIGITS.issuperset(val_clean[1:]):
+                _bucket_color(val_clean, var, first_seen, buckets)
+            continue
+        if not val_clean.startswith(_RGBA_PREFIXES):
             continue
 
         # --- RGB / RGBA ---------------------------------------------------------
-        m = _RGBA_RE.match(val_clean)
+        m = rgba_match(val_clean)
         if m:
             r, g, b, a = m.groups()
             # clamp / canonicalise channel ranges and build minimal form
@@ -815,20 +938,31 @@ def _dedupe_colors(css_vars):
                 # normalise alpha → strip trailing zeros, but keep one leading 0 if <1
                 a_norm = str(float(a)).rstrip("0").rstrip(".")
                 canon = f"rgba({r},{g},{b},{a_norm})"
-            buckets[canon].append(var)
+            _bucket_color(canon, var, first_seen, buckets)
             continue
 
     # ignore gradients / keywords etc.
-    # return buckets
-    return {lit: names for lit, names in buckets.items() if len(names) > 1}
+    return buckets
+
 
+def _bucket_color(literal, var, first_seen, buckets):
+    first = first_seen.setdefault(literal, var)
+    if first == var:
+        return
+    names = buckets.get(literal)
+    if names is None:
+        buckets[literal] = [first, var]
+    else:
+        names.append(var)
 
+
+@lru_cache(maxsize=512)
 def _make_shared_name(literal, index):
     """e.g. '#75beff', 1 → 'color_01_75beff'"""
     if literal.startswith("#"):
         return f"color_{index:02d}_{literal.lstrip('#')}"
     # rgb(a) → squeeze non-digits for brevity, e.g. rgba25525525507
-    squeezed = re.sub(r"[^0-9]+", "", literal)
+    squeezed = literal.translate(_NON_DIGIT_DELETION)
     return f"color_{index:02d}_rgb{squeezed}"
 
 
@@ -861,7 +995,10 @@ def _rewrite_defs(original_defs, dup_map):
     return shared_defs, rewritten
 
 
-CSS_TO_PARSE = """
+if __name__ == "__main__":
+    # Sample input for the demo below; kept out of the module namespace so
+    # importing theme_converter doesn't hold on to it.
+    CSS_TO_PARSE = """
 /*
  * These were copied from VSCode Dark High Contrast theme.
  *
@@ -1444,7 +1581,6 @@ body {
 */
 """
 
-if __name__ == "__main__":
     qss_output, extracted_metadata = parse_vscode_css_to_ida_qss_tinycss2(CSS_TO_PARSE)
 
     print("--- Generated IDA Pro QSS (using tinycss2) ---")
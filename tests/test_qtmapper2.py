@@ -0,0 +1,317 @@
+import importlib.util
+import pathlib
+import re
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+import qtmapper2  # noqa: E402
+
+HAS_TINYCSS2 = importlib.util.find_spec("tinycss2") is not None
+
+# Stylesheets the :root fast path accepts, at least in part, alongside ones
+# it has to hand back to tinycss2.
+ROOT_SAMPLES = [
+    ":root { --vscode-foreground: #cccccc; --vscode-focusBorder: #007fd4; }",
+    ":root{--a:#fff;--b:red;--a:#000;}",
+    ":root { --x: rgb(1, 2, 3); --y: #abc; --x: #abc; }\n:root { --y: blue; }",
+    ":root { --vscode-welcomePage-progress\\.background: #3794ff; }",
+    ":root { --a: rgba(255, 255, 0, .3); --b: 1px solid #123456; }",
+    ":root { --font: \"Segoe WPC\", \"Segoe UI\", sans-serif; --n: -1.5em; }",
+    ":root { --a: #fff; }\nbody { color: var(--a); }\n"
+    ".menubar-menu-button { color: red; }",
+    "/* lead */ :root { --a: /* inside */ #fff; --b: #FFF; }",
+    ":root { --a: linear-gradient(to right, #fff, #000); }",
+    ":root { --a: #\\31 23; --b: 1e3; }",
+    ":root { --a: 1px+2; --b: 5-3; }",
+    "body { margin: 0; }\n:root { --a: #fff; }",
+    ":root { --a: #-x; --b: #-1; --c: #--; --d: #_a; }",
+]
+
+_HEADER = (
+    "/* Generated IDA Pro QSS Theme from VSCode CSS (using tinycss2) */\n"
+    "/* For use with IDA Pro's QSS theming engine */\n\n"
+    "/* Variable Definitions */\n"
+)
+# Output of the converter as it stood before any of the fast paths, for
+# inputs it handled correctly.
+GOLDEN_QSS = {
+    ":root { --vscode-button-background: #0e639c;"
+    " --vscode-button-hoverBackground: #1177bb; }": _HEADER
+    + "@def --vscode-button-background  #0e639c;\n"
+    "@def --vscode-button-hoverBackground  #1177bb;\n\n\n"
+    "/* General Widget Styles */\n"
+    "QPushButton {\n  background-color: ${--vscode-button-background};\n}\n\n"
+    "QPushButton:hover {\n"
+    "  background-color: ${--vscode-button-hoverBackground};\n}\n",
+    ":root{--a:#fff;--b:red;--a:#000;}": _HEADER
+    + "@def --a #000;\n@def --a #fff;\n@def --b red;\n\n",
+    ":root { --x: rgb(1, 2, 3); --y: #abc; --x: #abc; }\n:root { --y: blue; }": (
+        _HEADER + "@def --x  #abc;\n@def --x  rgb(1, 2, 3);\n"
+        "@def --y  #abc;\n@def --y  blue;\n\n"
+    ),
+    ":root { --vscode-welcomePage-progress\\.background: #3794ff; }": _HEADER
+    + "@def --vscode-welcomePage-progress.background  #3794ff;\n\n",
+    ":root { --a: rgba(255, 255, 0, .3); --b: 1px solid #123456; }": _HEADER
+    + "@def --a  rgba(255, 255, 0, .3);\n@def --b  1px solid #123456;\n\n",
+    ":root { --a: #-x; --b: #-1; --c: #--; --d: #_a; }": _HEADER
+    + "@def --a  #-x;\n@def --b  #-1;\n@def --c  #--;\n@def --d  #_a;\n\n",
+}
+
+
+def _convert(css_content):
+    qtmapper2.parse_vscode_css_to_ida_qss_tinycss2.cache_clear()
+    return qtmapper2.parse_vscode_css_to_ida_qss_tinycss2(css_content)
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestRootFastPath(unittest.TestCase):
+    def assertSameAsTinycss2(self, css_content):
+        fast = _convert(css_content)
+        with mock.patch.object(qtmapper2, "_fast_parse_root", return_value=None):
+            slow = _convert(css_content)
+        self.assertEqual(fast, slow)
+
+    def test_samples_match_tinycss2(self):
+        for css_content in ROOT_SAMPLES:
+            with self.subTest(css=css_content):
+                self.assertSameAsTinycss2(css_content)
+
+    def test_golden_output(self):
+        for css_content, expected in GOLDEN_QSS.items():
+            with self.subTest(css=css_content):
+                self.assertEqual(_convert(css_content)[0], expected)
+                with mock.patch.object(
+                    qtmapper2, "_fast_parse_root", return_value=None
+                ):
+                    self.assertEqual(_convert(css_content)[0], expected)
+
+    def test_default_stylesheet_matches_tinycss2(self):
+        css_content = qtmapper2._load_default_css()
+        self.assertIsNotNone(
+            qtmapper2._fast_parse_root(qtmapper2._strip_css_comments(css_content))
+        )
+        self.assertSameAsTinycss2(css_content)
+        self.assertSameAsTinycss2(qtmapper2.trim_unused_vars(css_content))
+
+    def test_rest_of_stylesheet_is_still_parsed(self):
+        css_content = ":root { --a: #fff; }\nbody { color: red; }"
+        root_vars, rest = qtmapper2._fast_parse_root(css_content)
+        self.assertEqual([name for name, _, _ in root_vars], ["--a"])
+        self.assertEqual(rest.strip(), "body { color: red; }")
+        self.assertIn("body {\n  color:  red;\n}", _convert(css_content)[0])
+
+    def test_comments_inside_values_do_not_glue_tokens(self):
+        qss, _ = _convert(":root { --a: 1px/**/2px; }")
+        self.assertIn("@def --a  1px 2px;", qss)
+
+    def test_dash_hashes_follow_tinycss2(self):
+        # "#-1" cannot start an identifier, so it is a colour; "#-x", "#--"
+        # and "#_a" can, so they are not.
+        _, metadata = _convert(":root { --a: #-x; --b: #-1; --c: #--; --d: #_a; }")
+        self.assertEqual(tuple(metadata.unique_colors), ("#-1",))
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestStripCssComments(unittest.TestCase):
+    def test_url_tokens_are_not_comments(self):
+        import tinycss2
+
+        def tokens(css_content):
+            return [
+                token.serialize()
+                for token in tinycss2.parse_component_value_list(
+                    css_content, skip_comments=True
+                )
+                if token.type != "whitespace"
+            ]
+
+        samples = [
+            ":root{--a: url(img/*.png);}\n"
+            "body{color:red}/* x */.menubar-menu-button{color:blue}",
+            "url(/*x*/)",
+        ]
+        for css_content in samples:
+            with self.subTest(css=css_content):
+                self.assertEqual(
+                    tokens(qtmapper2._strip_css_comments(css_content)),
+                    tokens(css_content),
+                )
+        self.assertEqual(qtmapper2._strip_css_comments("url(/*x*/)"), "url(/*x*/)")
+
+    def test_url_value_survives_conversion(self):
+        qss, _ = _convert(
+            ":root{--a: url(img/*.png);}\n"
+            "body{color:red}/* x */.menubar-menu-button{color:blue}"
+        )
+        self.assertIn("@def --a  url(img/*.png);", qss)
+        self.assertIn("QMenuBar {\n  color: blue;\n}", qss)
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestSerializeToken(unittest.TestCase):
+    def test_matches_tinycss2_serialize(self):
+        import tinycss2
+
+        values = (
+            "red -x #fff #1e1e1e #\\31 23 #-x #-1 #\\66oo #é 1px 50% 1e3 -.5 +2"
+            " 'a b' \"c\" url(a.png) rgb(1, 2, 3) var(--a) , / !important @media"
+            " \\31 x [a] {b}"
+        )
+        for token in tinycss2.parse_component_value_list(values):
+            with self.subTest(token=token):
+                self.assertEqual(
+                    qtmapper2._serialize_token(token), tinycss2.serialize([token])
+                )
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestGeneralRules(unittest.TestCase):
+    def test_mapped_selector_list(self):
+        qss, _ = _convert(
+            ".monaco-workbench .menubar-menu-button, .menubar-menu-title:hover"
+            " { color: red; background-color: var(--a); unknown-prop: 1; }"
+        )
+        self.assertIn(
+            "QMenuBar, QMenuBar::item:hover {\n"
+            "  color:  red;\n"
+            "  background-color:  ${--a};\n"
+            "}",
+            qss,
+        )
+        self.assertNotIn("unknown-prop", qss)
+
+    def test_unmapped_selector_is_skipped(self):
+        qss, _ = _convert(".foo, div > span { color: blue; }")
+        self.assertNotIn("General Widget Styles", qss)
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestParseCaches(unittest.TestCase):
+    def test_parse_css_rules_is_memoized(self):
+        css_content = ".menubar-menu-button { color: red; }"
+        first = qtmapper2._parse_css_rules(css_content)
+        self.assertIs(qtmapper2._parse_css_rules(css_content), first)
+        self.assertEqual(first[0][0], ".menubar-menu-button")
+        self.assertEqual([d.name for d in first[0][1]], ["color"])
+
+    def test_cached_conversion_matches_fresh_one(self):
+        css_content = ":root { --vscode-foreground: #ccc; }\nbody { color: red; }"
+        fresh = _convert(css_content)
+        self.assertIs(
+            qtmapper2.parse_vscode_css_to_ida_qss_tinycss2(css_content), fresh
+        )
+        qtmapper2._parse_css_rules.cache_clear()
+        self.assertEqual(_convert(css_content), fresh)
+
+
+class TestStyleMap(unittest.TestCase):
+    def test_entries_keep_their_section(self):
+        for entry in qtmapper2.vscode_var_to_qt_style_map():
+            with self.subTest(pattern=entry["vscode_var_pattern"]):
+                self.assertIsInstance(entry["section"], str)
+                self.assertTrue(entry["section"])
+
+    def test_old_table_name_still_resolves(self):
+        self.assertIs(
+            qtmapper2.VSCODE_VAR_TO_QT_STYLE_MAP,
+            qtmapper2.vscode_var_to_qt_style_map(),
+        )
+
+
+class TestColorParsing(unittest.TestCase):
+    # The patterns parse_hex() stands in for.
+    HEX_RE = re.compile(r"\A#(?:[0-9a-f]{3}){1,2}\Z", re.I)
+
+    def test_parse_hex(self):
+        samples = [
+            "#abc",
+            "#ABC",
+            "#a1b2c3",
+            "#abcd",
+            "abc",
+            "#ggg",
+            "#12345",
+            "#",
+            "",
+            "#abc ",
+            "#１２３",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                rgb = qtmapper2.parse_hex(text)
+                self.assertEqual(rgb is not None, bool(self.HEX_RE.match(text)))
+                if rgb is not None:
+                    digits = text[1:]
+                    if len(digits) == 3:
+                        digits = "".join(c * 2 for c in digits)
+                    self.assertEqual(
+                        rgb, tuple(int(digits[i : i + 2], 16) for i in (0, 2, 4))
+                    )
+
+    def test_parse_rgba(self):
+        samples = [
+            "rgb(1,2,3)",
+            "RGB(1, 2, 3)",
+            "rgba(1, 2, 3, .5)",
+            "rgba( 10 ,20,30 , 0.25 )",
+            "rgba(1,2,3,1.)",
+            "rgb(1,2)",
+            "rgb(1000,2,3)",
+            "rgba(1,2,3,4,5)",
+            "rgb(1,2,3",
+            "hsl(1,2,3)",
+            "rgba(1,2,3,-1)",
+            "rgb(\t1,\n2,3)",
+            "rgb(١,2,3)",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                m = qtmapper2._RGBA_RE.match(text)
+                expected = None
+                if m:
+                    r, g, b, a = m.groups()
+                    alpha = None if a is None else float(a)
+                    expected = (int(r), int(g), int(b), alpha)
+                self.assertEqual(qtmapper2.parse_rgba(text), expected)
+
+    def test_rgba_is_ascii_only_and_fully_anchored(self):
+        for text in ("rgb(١,2,3)", "rgb(1,2,3)\n", "rgb(1,2,3 )"):
+            with self.subTest(text=text):
+                self.assertIsNone(qtmapper2._RGBA_RE.match(text))
+                self.assertIsNone(qtmapper2.parse_rgba(text))
+
+
+@unittest.skipUnless(HAS_TINYCSS2, "tinycss2 is not installed")
+class TestTrimUnusedVars(unittest.TestCase):
+    def test_keeps_mapped_and_referenced_vars(self):
+        css_content = (
+            ":root { --vscode-foreground: #ccc; --unused: #111; --used: #222; }\n"
+            "body { color: var(--used); }"
+        )
+        trimmed = qtmapper2.trim_unused_vars(css_content)
+        self.assertIn("--vscode-foreground", trimmed)
+        self.assertIn("--used: #222", trimmed)
+        self.assertNotIn("--unused", trimmed)
+
+    def test_default_stylesheet_widget_rules_unchanged(self):
+        css_content = qtmapper2._load_default_css()
+        full_qss, full_metadata = _convert(css_content)
+        trimmed_qss, trimmed_metadata = _convert(
+            qtmapper2.trim_unused_vars(css_content)
+        )
+        marker = "/* General Widget Styles */"
+        self.assertEqual(trimmed_qss.split(marker)[1], full_qss.split(marker)[1])
+
+        # Shared colour names are numbered per run, so only the theme's own
+        # variables are compared.
+        def own_vars(metadata):
+            return {name for name in metadata.css_variables if name.startswith("--")}
+
+        self.assertLess(own_vars(trimmed_metadata), own_vars(full_metadata))
+
+
+if __name__ == "__main__":
+    unittest.main()